@@ -22,7 +22,6 @@ Core responsibilities:
 - Manage active sessions across reruns
 """
 import streamlit as st
-from dotenv import load_dotenv
 from src.agents.orchestrator_agent import AgenticOrchestrator
 from datetime import datetime
 import plotly.express as px
@@ -30,7 +29,7 @@ import pandas as pd
 import time
 import io
 import sys
-import json
+import orjson
 
 def render_response(response):
     """
@@ -39,7 +38,7 @@ def render_response(response):
     - Else → show as markdown
     """
     try:
-        data = json.loads(response)
+        data = orjson.loads(response)
 
         # Check if it's a project plan
         if "title" in data and "tasks" in data:
@@ -69,8 +68,6 @@ def render_response(response):
     else:
         st.markdown(response)
 
-load_dotenv()
-
 # Page config
 st.set_page_config(
     page_title="AI Project Assistant (Agentic)",
@@ -358,7 +355,10 @@ with tab2:
         today = datetime.today()
 
         # 🔥 NORMALIZE TASKS (CRITICAL FIX)
+        tasks_changed = False
+
         for t in tasks:
+            original = (t.get("status"), t.get("start_date"), t.get("end_date"))
 
             # ---------- STATUS FIX ----------
             if not t.get("status") or t["status"] not in ["To-Do", "In Progress", "Completed"]:
@@ -389,8 +389,13 @@ with tab2:
             t["start_date"] = start_dt.strftime("%Y-%m-%d")
             t["end_date"] = end_dt.strftime("%Y-%m-%d")
 
-        # ✅ Save normalized data
-        st.session_state.app.db.save_project(project)
+            if (t["status"], t["start_date"], t["end_date"]) != original:
+                tasks_changed = True
+
+        # ✅ Save normalized data (only when something actually changed,
+        # since this block runs on every Streamlit rerun)
+        if tasks_changed:
+            st.session_state.app.db.save_project(project)
 
         # 🔥 DEADLINE WITH PERSISTENCE + SMART TIMELINE
         st.divider()
@@ -534,10 +539,12 @@ with tab2:
         with subtab3:
             st.subheader("🧱 Kanban Board")
 
+            # Index tasks once so status updates are a direct lookup.
+            tasks_by_id = {t["id"]: t for t in project["tasks"]}
+
             def update_task_status(task_id, new_status):
-                for t in project["tasks"]:
-                    if t["id"] == task_id:
-                        t["status"] = new_status
+                if task_id in tasks_by_id:
+                    tasks_by_id[task_id]["status"] = new_status
 
                 st.session_state.app.db.save_project(project)
 
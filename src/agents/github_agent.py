@@ -16,9 +16,8 @@ Main responsibilities:
 """
 
 from typing import TypedDict, List, Dict
-import os
 import base64
-from dotenv import load_dotenv
+from urllib.parse import urlparse
 from github import Auth, Github, GithubException
 from langgraph.graph import StateGraph, END
 
@@ -28,6 +27,9 @@ from src.database.mongo_vector_store import MongoVectorMemory
 # Shared LLM factory.
 from src.core.llm import get_llm
 
+# Centralized environment configuration.
+from src.core.config import GITHUB_TOKEN, GITHUB_SUMMARY_CONCURRENCY
+
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.documents import Document
 
@@ -36,23 +38,61 @@ from langchain_core.documents import Document
 # Configuration / Setup
 # -------------------------------------------------------------------
 
-load_dotenv()
-
-github_token = os.getenv("GITHUB_TOKEN")
-
-if not github_token:
+if not GITHUB_TOKEN:
     raise ValueError("GITHUB_TOKEN not set in .env file")
 
 # Shared language model.
 llm = get_llm()
 
 # Authenticated GitHub client.
-auth = Auth.Token(github_token)
+auth = Auth.Token(GITHUB_TOKEN)
 g = Github(auth=auth)
 
 # Shared vector memory instance.
 memory = MongoVectorMemory()
 
+# -------------------------------------------------------------------
+# Prompts
+# -------------------------------------------------------------------
+
+# Templates and chains are built once at import and reused for every
+# repository instead of being reconstructed on each analysis.
+
+# Overall repository summary prompt.
+summary_prompt = ChatPromptTemplate.from_messages([
+    ("system", "You are a senior software architect."),
+    ("human", """
+    Analyze this repository and provide:
+
+    1. Project Purpose
+    2. Core Features
+    3. Tech Stack (IMPORTANT)
+    4. Architecture Overview
+
+    {context}
+    """)
+])
+
+summary_chain = summary_prompt | llm
+
+# File-specific analysis prompt.
+file_prompt = ChatPromptTemplate.from_messages([
+    ("system", "You analyze code files."),
+    ("human", """
+    File: {path}
+
+    Content:
+    {content}
+
+    Provide:
+    - Purpose
+    - Key functions/classes
+    - Dependencies/interactions
+    """)
+])
+
+file_chain = file_prompt | llm
+
 
 # -------------------------------------------------------------------
 # Graph State Definition
@@ -69,6 +109,35 @@ class GraphState(TypedDict):
     error: str
 
 
+# -------------------------------------------------------------------
+# URL Parsing
+# -------------------------------------------------------------------
+
+def _repo_path(repo_url: str):
+    """
+    Extract "owner/name" from a GitHub repository URL.
+
+    Args:
+        repo_url: GitHub repository URL.
+
+    Returns:
+        Repository path string, or None if the URL is not a GitHub
+        repository URL.
+    """
+    parsed = urlparse(repo_url)
+
+    # Ensure user provided a GitHub URL.
+    if parsed.netloc != "github.com":
+        return None
+
+    parts = parsed.path.strip("/").split("/")
+
+    if len(parts) < 2:
+        return None
+
+    return f"{parts[0]}/{parts[1]}"
+
+
 # -------------------------------------------------------------------
 # Node 1: Fetch Repository Files
 # -------------------------------------------------------------------
@@ -90,22 +159,11 @@ def fetch_repo_contents(state: GraphState) -> GraphState:
     print("--- 🔎 Fetching Repository Contents ---")
 
     try:
-        from urllib.parse import urlparse
-
-        repo_url = state["repo_url"]
-        parsed = urlparse(repo_url)
+        repo_path = _repo_path(state["repo_url"])
 
-        # Ensure user provided a GitHub URL.
-        if parsed.netloc != "github.com":
+        if not repo_path:
             return {**state, "error": "Invalid GitHub URL"}
 
-        parts = parsed.path.strip("/").split("/")
-
-        if len(parts) < 2:
-            return {**state, "error": "Invalid GitHub URL"}
-
-        repo_path = f"{parts[0]}/{parts[1]}"
-
         repo = g.get_repo(repo_path)
         contents = repo.get_contents("")
 
@@ -182,58 +240,36 @@ def analyze_and_summarize(state: GraphState) -> GraphState:
         for f in state["repo_contents"]
     ])
 
-    # Overall repository summary prompt.
-    summary_prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a senior software architect."),
-        ("human", """
-        Analyze this repository and provide:
-
-        1. Project Purpose
-        2. Core Features
-        3. Tech Stack (IMPORTANT)
-        4. Architecture Overview
-
-        {context}
-        """)
-    ])
-
-    summary = (summary_prompt | llm).invoke({
+    summary = summary_chain.invoke({
         "context": full_context
     }).content
 
-    # File-specific analysis prompt.
-    file_prompt = ChatPromptTemplate.from_messages([
-        ("system", "You analyze code files."),
-        ("human", """
-        File: {path}
-
-        Content:
-        {content}
-
-        Provide:
-        - Purpose
-        - Key functions/classes
-        - Dependencies/interactions
-        """)
-    ])
+    # Summarize all files in one batched call instead of one blocking
+    # request per file; failures are returned in place, logged, and skipped.
+    file_summaries = file_chain.batch(
+        [
+            {"path": f["path"], "content": f["content"]}
+            for f in state["repo_contents"]
+        ],
+        config={"max_concurrency": GITHUB_SUMMARY_CONCURRENCY},
+        return_exceptions=True
+    )
 
     documents = []
 
-    for f in state["repo_contents"]:
-        try:
-            file_summary = (file_prompt | llm).invoke({
-                "path": f["path"],
-                "content": f["content"]
-            }).content
-
-            documents.append(Document(
-                page_content=file_summary,
-                metadata={"source": f["path"]}
-            ))
-
-        except Exception:
+    for f, file_summary in zip(state["repo_contents"], file_summaries):
+        if isinstance(file_summary, Exception):
+            print(
+                f"Skipped {f['path']}: "
+                f"{type(file_summary).__name__}: {file_summary}"
+            )
             continue
 
+        documents.append(Document(
+            page_content=file_summary.content,
+            metadata={"source": f["path"]}
+        ))
+
     return {
         **state,
         "project_summary": summary,
@@ -303,6 +339,35 @@ app = workflow.compile()
 # Public Entry Point
 # -------------------------------------------------------------------
 
+def get_repo_head_sha(repo_url: str):
+    """
+    Return the latest commit SHA on a repository's default branch.
+
+    Used to tell whether a previously analyzed repository has changed.
+    This costs one GitHub API request per analysis, which is accepted
+    since it is far cheaper than re-summarizing an unchanged repository.
+
+    Args:
+        repo_url: GitHub repository URL.
+
+    Returns:
+        Commit SHA string, or None if it could not be fetched.
+    """
+
+    try:
+        repo_path = _repo_path(repo_url)
+
+        if not repo_path:
+            return None
+
+        # Lazy repo plus "HEAD" resolves the default branch in a single
+        # request instead of fetching the repo and then the branch.
+        return g.get_repo(repo_path, lazy=True).get_commit("HEAD").sha
+
+    except Exception:
+        return None
+
+
 def run_github_analysis(repo_url: str) -> Dict:
     """
     Execute complete GitHub analysis workflow.
@@ -14,12 +14,39 @@ Typical use cases:
 - Answer follow-up clarification questions
 """
 from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, SystemMessage
 from src.core.llm import get_llm
-import json
 
 llm = get_llm()
 
+# Static instructions sent as a leading system message so the prompt
+# prefix is identical across turns and eligible for Gemini's implicit
+# context caching.
+IDEA_SYSTEM_PROMPT = """
+You are an expert AI startup/product strategist.
+
+Your job:
+
+- If user asks summary → summarize clearly
+- If asks refine idea → improve it
+- If asks add/change/remove features → update idea intelligently
+- If asks compare tech stacks/options → compare with pros/cons
+- If asks explain tasks/research → explain simply
+- If asks clarification → answer naturally
+- If asks next steps → provide guidance
+
+Rules:
+- Be practical
+- Be concise
+- Be helpful
+- Do NOT generate task JSON
+- Do NOT generate literature review unless explicitly asked
+
+Give best response.
+"""
+
+IDEA_SYSTEM_MESSAGE = SystemMessage(content=IDEA_SYSTEM_PROMPT)
+
 
 class IdeaAgent:
     """
@@ -32,49 +59,29 @@ class IdeaAgent:
         """Initialize the agent with the shared LLM instance."""
         self.llm = llm
 
-    def respond(self, user_input: str, project_context: dict) -> str:
+    def respond(self, user_input: str, project_context: str) -> str:
         """
         Generate a context-aware response for a follow-up request.
 
         Args:
             user_input: Latest user query or request.
-            project_context: Existing project data used for grounding.
+            project_context: Existing project data, already serialized
+                as JSON, used for grounding.
 
         Returns:
             Natural language assistant response.
         """        
 
         prompt = f"""
-You are an expert AI startup/product strategist.
-
 Current Project:
-{json.dumps(project_context, indent=2)}
+{project_context}
 
 User Request:
 {user_input}
-
-Your job:
-
-- If user asks summary → summarize clearly
-- If asks refine idea → improve it
-- If asks add/change/remove features → update idea intelligently
-- If asks compare tech stacks/options → compare with pros/cons
-- If asks explain tasks/research → explain simply
-- If asks clarification → answer naturally
-- If asks next steps → provide guidance
-
-Rules:
-- Be practical
-- Be concise
-- Be helpful
-- Do NOT generate task JSON
-- Do NOT generate literature review unless explicitly asked
-
-Give best response.
 """
 
         return self.llm.invoke(
-            [HumanMessage(content=prompt)]
+            [IDEA_SYSTEM_MESSAGE, HumanMessage(content=prompt)]
         ).content
 
 
@@ -105,8 +112,9 @@ def idea_followup_tool(user_input: str, project_context: str) -> str:
     """
     Tool wrapper for the IdeaAgent.
 
-    Accepts serialized project context, safely converts it into a Python
-    dictionary, and returns a conversational response.
+    Accepts serialized project context and passes it to the prompt as-is,
+    avoiding a parse/re-serialize round trip, then returns a
+    conversational response.
 
     Args:
         user_input: Latest user request.
@@ -117,9 +125,4 @@ def idea_followup_tool(user_input: str, project_context: str) -> str:
     """
     agent = get_idea_agent()
 
-    try:
-        project_context = json.loads(project_context)
-    except:
-        project_context = {}
-
-    return agent.respond(user_input, project_context)
\ No newline at end of file
+    return agent.respond(user_input, project_context or "{}")
\ No newline at end of file
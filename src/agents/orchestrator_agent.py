@@ -24,23 +24,25 @@ from typing import TypedDict, Annotated, Sequence, Literal
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
-from src.agents.github_agent import run_github_analysis
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from src.agents.github_agent import run_github_analysis, get_repo_head_sha
 
-import json
+import orjson
 import re
 from datetime import datetime
 import uuid
-from dotenv import load_dotenv
-
-load_dotenv()
+import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from src.database.mongo_db import MongoDB
 from src.memory.memory import Memory
 
 from src.agents.planner_agent import generate_project_plan_tool
+from src.core.plan_cache import get_plan_cache
 
 
-from src.core.llm import get_llm
+from src.core.llm import get_llm, get_fast_llm
 from src.agents.idea_agent import idea_followup_tool
 
 from src.agents.research_agent import (
@@ -48,6 +50,104 @@ from src.agents.research_agent import (
     generate_literature_review_tool
 )
 
+# Number of recent chat messages kept for end-of-session persistence.
+MAX_HISTORY_MESSAGES = 20
+
+# ---------------------------------------------------
+# Supervisor Prompt
+# ---------------------------------------------------
+
+# Built once and always sent first so the supervisor fallback shares a
+# stable prompt prefix that Gemini can reuse from its context cache.
+SUPERVISOR_SYSTEM_PROMPT = """
+    You are a supervisor agent.
+
+    Choose best agent.
+
+    Agents:
+
+    planning → create plans, tasks, milestones, timelines
+
+    research → papers, literature review, surveys
+
+    github → repository/code/GitHub analysis
+
+    idea → implementation help, summaries, explanations,
+    follow-up questions, refinements, comparisons
+
+    IMPORTANT:
+    If unsure, choose idea.
+
+    Return JSON ONLY:
+
+    {
+    "agent":"planning | research | github | idea | end",
+    "reason":"why"
+    }
+    """
+
+SUPERVISOR_SYSTEM_MESSAGE = SystemMessage(content=SUPERVISOR_SYSTEM_PROMPT)
+
+# Bound to the router model once; each turn only supplies the messages.
+SUPERVISOR_PROMPT = ChatPromptTemplate.from_messages([
+    SUPERVISOR_SYSTEM_MESSAGE,
+    MessagesPlaceholder("messages")
+])
+
+
+# ---------------------------------------------------
+# Routing Rules
+# ---------------------------------------------------
+
+def _keyword_pattern(keywords):
+    """Compile a keyword list into one substring-matching regex."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+# Compiled once so each supervisor turn does a single scan per category
+# instead of rebuilding the lists and testing every keyword separately.
+HOW_PATTERN = _keyword_pattern([
+    "how to", "how do i", "how can i",
+    "implement", "explain", "guide me",
+    "best way", "help me build","make system", "i want to build", "i want to create"
+])
+
+FOLLOWUP_PATTERN = _keyword_pattern([
+    "summary", "summarize", "clarify",
+    "refine", "improve", "compare",
+    "simplify", "why", "what next",
+    "tell me more", "details",
+    "can you explain", "elaborate"
+])
+
+PLANNING_PATTERN = _keyword_pattern([
+    "generate plan", "project plan",
+    "roadmap", "timeline",
+    "create tasks", "milestones",
+    "task breakdown", "full plan",
+    "build project plan"
+])
+
+RESEARCH_PATTERN = _keyword_pattern([
+    "literature review", "research paper",
+    "papers on", "survey paper",
+    "recent papers", "academic papers"
+])
+
+# Explicit requests for a fresh plan skip the plan cache.
+REGENERATE_PATTERN = _keyword_pattern([
+    "regenerate", "redo", "re-do", "new plan",
+    "again", "revise", "update plan", "fresh plan",
+    "start over", "from scratch"
+])
+
+GITHUB_URL_PATTERN = re.compile(r'https://github\.com/[^\s]+')
+
+# Project fields that change on every save and must not affect the
+# plan cache key.
+VOLATILE_PROJECT_FIELDS = {"id", "created_at", "last_modified"}
+
+
 # ---------------------------------------------------
 # Agent State
 # ---------------------------------------------------
@@ -79,12 +179,29 @@ class AgenticOrchestrator:
 
         self.llm = get_llm()
 
+        # Routing only needs a short JSON decision, so use the fast model.
+        self.router_llm = get_fast_llm()
+        self.supervisor_chain = SUPERVISOR_PROMPT | self.router_llm
+
         self.db = MongoDB()
         self.memory = Memory(self.db)
 
+        # Load the persisted plan cache now rather than inside the first
+        # planning turn, so that turn's latency matches later ones.
+        get_plan_cache()
+
         self.current_project_id = None
         self.current_project = None
-        self.messages_history = []
+        # Bounded transcript buffer; old turns fall off without copying.
+        self.messages_history = deque(maxlen=MAX_HISTORY_MESSAGES)
+
+        # Per-session cache of expensive tool results keyed by tool name
+        # and canonicalized arguments.
+        self.tool_cache = {}
+
+        # Single worker keeps live memory updates in submission order.
+        self.memory_executor = ThreadPoolExecutor(max_workers=1)
+        self.pending_memory_update = None
 
         self.app = self._build_graph()
 
@@ -146,7 +263,8 @@ class AgenticOrchestrator:
             state: Current workflow state.
 
         Returns:
-            Updated state containing routing decision message.
+            Partial state update with only the routing decision message;
+            the add_messages reducer appends it to the history.
         """
         user_input = ""
 
@@ -160,71 +278,42 @@ class AgenticOrchestrator:
         # HARD RULES (prevent wrong LLM routing)
         # ==================================================
 
-        how_keywords = [
-            "how to", "how do i", "how can i",
-            "implement", "explain", "guide me",
-            "best way", "help me build","make system", "i want to build", "i want to create"
-        ]
-
-        followup_keywords = [
-            "summary", "summarize", "clarify",
-            "refine", "improve", "compare",
-            "simplify", "why", "what next",
-            "tell me more", "details",
-            "can you explain", "elaborate"
-        ]
-
-        planning_keywords = [
-            "generate plan", "project plan",
-            "roadmap", "timeline",
-            "create tasks", "milestones",
-            "task breakdown", "full plan",
-            "build project plan"
-        ]
-
-        research_keywords = [
-            "literature review", "research paper",
-            "papers on", "survey paper",
-            "recent papers", "academic papers"
-        ]
-
-
         # ---------- GitHub ----------
         if "github.com/" in user_input:
             return {
-                "messages": state["messages"] + [
+                "messages": [
                     AIMessage(content='{"agent":"github","reason":"GitHub URL detected"}')
                 ]
             }
 
         # ---------- Research ----------
-        if any(k in user_input for k in research_keywords):
+        if RESEARCH_PATTERN.search(user_input):
             return {
-                "messages": state["messages"] + [
+                "messages": [
                     AIMessage(content='{"agent":"research","reason":"research request"}')
                 ]
             }
 
 
         # ---------- Planning ----------
-        if any(k in user_input for k in planning_keywords):
+        if PLANNING_PATTERN.search(user_input):
             return {
-                "messages": state["messages"] + [
+                "messages": [
                     AIMessage(content='{"agent":"planning","reason":"planning request"}')
                 ]
             }
 
         # ---------- Idea / Follow-up ----------
-        if any(k in user_input for k in how_keywords):
+        if HOW_PATTERN.search(user_input):
             return {
-                "messages": state["messages"] + [
+                "messages": [
                     AIMessage(content='{"agent":"idea","reason":"implementation/how-to request"}')
                 ]
             }
 
-        if any(k in user_input for k in followup_keywords):
+        if FOLLOWUP_PATTERN.search(user_input):
             return {
-                "messages": state["messages"] + [
+                "messages": [
                     AIMessage(content='{"agent":"idea","reason":"follow-up request"}')
                 ]
             }
@@ -233,38 +322,9 @@ class AgenticOrchestrator:
         # LLM FALLBACK
         # ==================================================
 
-        system_prompt = """
-    You are a supervisor agent.
-
-    Choose best agent.
-
-    Agents:
-
-    planning → create plans, tasks, milestones, timelines
-
-    research → papers, literature review, surveys
-
-    github → repository/code/GitHub analysis
-
-    idea → implementation help, summaries, explanations,
-    follow-up questions, refinements, comparisons
-
-    IMPORTANT:
-    If unsure, choose idea.
-
-    Return JSON ONLY:
-
-    {
-    "agent":"planning | research | github | idea | end",
-    "reason":"why"
-    }
-    """
-
-        messages = [SystemMessage(content=system_prompt)] + list(state["messages"])
-
-        response = self.llm.invoke(messages)
+        response = self.supervisor_chain.invoke({"messages": state["messages"]})
 
-        return {"messages": state["messages"] + [response]}
+        return {"messages": [response]}
 
 # ---------------------------------------------------
 # Routing Logic
@@ -291,7 +351,7 @@ class AgenticOrchestrator:
         decision_text = state["messages"][-1].content
 
         try:
-            parsed = json.loads(decision_text)
+            parsed = orjson.loads(decision_text)
             decision = parsed.get("agent", "").lower()
         except:
             decision = decision_text.lower()
@@ -336,12 +396,48 @@ class AgenticOrchestrator:
         {project_context}
         """
 
-        result = generate_project_plan_tool.invoke({
-            "conversation_context": conversation
-        })
+        # Cache key: the full refinement context (memory, user requests
+        # and saved project state) minus IDs and timestamps, so a plan is
+        # only reused when nothing that shapes it has changed.
+        project_state = {
+            k: v for k, v in project_context.items()
+            if k not in VOLATILE_PROJECT_FIELDS
+        }
+
+        plan_context = "\n".join(
+            m.content for m in state["messages"] if not isinstance(m, AIMessage)
+        )
+        plan_context += "\n" + orjson.dumps(
+            project_state, option=orjson.OPT_SORT_KEYS, default=str
+        ).decode()
+
+        user_request = "\n".join(
+            m.content for m in state["messages"] if isinstance(m, HumanMessage)
+        )
+        regenerate = bool(REGENERATE_PATTERN.search(user_request.lower()))
+
+        cache = get_plan_cache()
+        result = None if regenerate else cache.get(state["project_id"], plan_context)
+
+        from_cache = result is not None
+
+        if from_cache:
+            print("PLAN CACHE HIT")
+        else:
+            result = generate_project_plan_tool.invoke({
+                "conversation_context": conversation
+            })
 
         try:
-            project_data = json.loads(result)
+            project_data = orjson.loads(result)
+
+            # Only cache fresh plans that downstream code can parse.
+            if not from_cache:
+                # A regenerated plan replaces every earlier one.
+                if regenerate:
+                    cache.invalidate(state["project_id"])
+
+                cache.put(state["project_id"], plan_context, result)
 
             project_data["id"] = state["project_id"]
 
@@ -395,10 +491,21 @@ class AgenticOrchestrator:
 
         query = " ".join(keywords)
 
-        result = generate_literature_review_tool.invoke({
+        tool_args = {
             "query": query,
             "project_description": state["current_project"].get("description", query)
-        })
+        }
+
+        key = self._tool_cache_key("generate_literature_review_tool", tool_args)
+
+        if key in self.tool_cache:
+            result = self.tool_cache[key]
+        else:
+            result = generate_literature_review_tool.invoke(tool_args)
+
+            # Search failures are not cached so the user can simply retry.
+            if not result.startswith("❌"):
+                self.tool_cache[key] = result
 
         return {"messages": [AIMessage(content=result)]}
 
@@ -437,7 +544,7 @@ class AgenticOrchestrator:
         print("REAL USER INPUT >>>", repr(user_input))
 
         # ✅ 2. Robust GitHub URL extraction
-        match = re.search(r'https://github\.com/[^\s]+', user_input)
+        match = GITHUB_URL_PATTERN.search(user_input)
 
         if not match:
             return {
@@ -451,7 +558,23 @@ class AgenticOrchestrator:
         print("EXTRACTED URL:", github_url)
 
         # ✅ 3. Run analysis
-        result = run_github_analysis(github_url)
+        # The head commit is part of the key so newly pushed code is
+        # re-analyzed; without a SHA the analysis always runs.
+        head_sha = get_repo_head_sha(github_url)
+
+        key = self._tool_cache_key(
+            "run_github_analysis",
+            {"repo_url": github_url, "head_sha": head_sha}
+        )
+
+        if head_sha and key in self.tool_cache:
+            result = self.tool_cache[key]
+        else:
+            result = run_github_analysis(github_url)
+
+            # Failures are not cached so the user can simply retry.
+            if head_sha and result["success"]:
+                self.tool_cache[key] = result
 
         if not result["success"]:
             return {
@@ -520,12 +643,37 @@ class AgenticOrchestrator:
 
         result = idea_followup_tool.invoke({
             "user_input": user_input,
-            "project_context": json.dumps(project_context)
+            "project_context": orjson.dumps(
+                project_context,
+                option=orjson.OPT_INDENT_2
+            ).decode()
         })
 
         return {"messages": [AIMessage(content=result)]}
 
 
+# ---------------------------------------------------
+# Tool Result Cache
+# ---------------------------------------------------
+
+    def _tool_cache_key(self, tool_name: str, tool_args: dict) -> str:
+        """
+        Build a session tool-cache key from a tool name and its arguments.
+
+        Args:
+            tool_name: Name of the tool or agent function.
+            tool_args: Arguments passed to the tool.
+
+        Returns:
+            Stable cache key string.
+        """
+        digest = hashlib.sha1(
+            orjson.dumps(tool_args, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+
+        return f"{tool_name}:{digest}"
+
+
 # ---------------------------------------------------
 # Session Management
 # ---------------------------------------------------
@@ -539,6 +687,10 @@ class AgenticOrchestrator:
         """
 
 
+        self._wait_for_memory_update()
+
+        self.tool_cache = {}
+
         if project_id:
             self.current_project_id = project_id
             self.current_project = self.db.get_project(project_id)
@@ -584,6 +736,9 @@ class AgenticOrchestrator:
         """
         print("USER INPUT:", user_input)
 
+        # Previous turn's memory must be stored before it is read back.
+        self._wait_for_memory_update()
+
         self.messages_history.append({
             "role": "user",
             "content": user_input
@@ -650,25 +805,48 @@ class AgenticOrchestrator:
             self.current_project["description"] = user_input
             self.db.save_project(self.current_project)
 
-        if len(self.messages_history) > 20:
-            self.messages_history = self.messages_history[-20:]
-
         # ✅ LIVE MEMORY UPDATE AFTER EACH CHAT TURN
+        # Runs in the background so the reply is returned without waiting
+        # on the summary LLM call, embedding and MongoDB writes.
+        latest_messages = [
+            HumanMessage(content=user_input),
+            AIMessage(content=content)
+        ]
+
+        self.pending_memory_update = self.memory_executor.submit(
+            self._update_live_memory,
+            self.current_project_id,
+            latest_messages
+        )
+
+        return content
+
+
+# ---------------------------------------------------
+# Background Memory Updates
+# ---------------------------------------------------
+
+    def _update_live_memory(self, project_id: str, messages: list):
+        """
+        Save the latest chat turn into rolling session memory.
+
+        Args:
+            project_id: Project the turn belongs to.
+            messages: Latest user and assistant messages.
+        """
         try:
-            latest_messages = [
-                HumanMessage(content=user_input),
-                AIMessage(content=content)
-            ]
-
-            self.memory.save_session(
-                self.current_project_id,
-                latest_messages
-            )
+            self.memory.save_session(project_id, messages)
 
         except Exception as e:
             print("Live memory update error:", e)
 
-        return content
+    def _wait_for_memory_update(self):
+        """
+        Block until the pending background memory update has finished.
+        """
+        if self.pending_memory_update is not None:
+            self.pending_memory_update.result()
+            self.pending_memory_update = None
 
 
 # ---------------------------------------------------
@@ -680,6 +858,8 @@ class AgenticOrchestrator:
         Persist the final conversation history and close active
         rolling sessions for the current project.
         """
+        self._wait_for_memory_update()
+
         if not self.messages_history:
             return
 
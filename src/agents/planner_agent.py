@@ -12,45 +12,34 @@ This module is used when the user's idea is clear enough to be broken
 down into milestones or implementation steps.
 """
 from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, SystemMessage
 import os
 import re
 from src.core.llm import get_llm
 
 llm = get_llm()
 
-
-@tool
-def generate_project_plan_tool(conversation_context: str) -> str:
-    """
-    Generate a structured project plan from discussion history.
-
-    Args:
-        conversation_context: Combined conversation text describing
-            the user's project idea, requirements, and preferences.
-
-    Returns:
-        JSON string containing project metadata and task list.
-    """    
-    print("🔧 Agent is using tool: generate_project_plan_tool")
-    prompt = f"""
+# Static planner instructions. Kept as a fixed leading system message so
+# every request shares an identical prompt prefix, which Gemini can serve
+# from its implicit context cache instead of re-processing each call.
+PLAN_SYSTEM_PROMPT = """
 Create a project plan as valid JSON.
 
 Return:
 
-{{
+{
   "title":"",
   "description":"",
   "sequence_diagram":"plain text sequence diagram",
   "tasks":[
-    {{
+    {
       "id":1,
       "title":"",
       "description":"",
       "status":"To-Do"
-    }}
+    }
   ]
-}}
+}
 
 RULES:
 
@@ -113,13 +102,32 @@ Web App --> User : Order confirmed
 
 Keep it readable and practical.
 
-Conversation:
-{conversation_context}
-
 Return only valid JSON.
 """
-    
-    response = llm.invoke([HumanMessage(content=prompt)]).content
+
+PLAN_SYSTEM_MESSAGE = SystemMessage(content=PLAN_SYSTEM_PROMPT)
+
+
+@tool
+def generate_project_plan_tool(conversation_context: str) -> str:
+    """
+    Generate a structured project plan from discussion history.
+
+    Args:
+        conversation_context: Combined conversation text describing
+            the user's project idea, requirements, and preferences.
+
+    Returns:
+        JSON string containing project metadata and task list.
+    """    
+    print("🔧 Agent is using tool: generate_project_plan_tool")
+
+    messages = [
+        PLAN_SYSTEM_MESSAGE,
+        HumanMessage(content=f"Conversation:\n{conversation_context}")
+    ]
+
+    response = llm.invoke(messages).content
     print("TOOL OUTPUT BEFORE STRIP:", response)
     response = response.replace('```json', '').replace('```', '').strip()
     print("TOOL OUTPUT AFTER STRIP:", response)
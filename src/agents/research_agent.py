@@ -28,6 +28,10 @@ from src.core.llm import get_llm
 
 llm = get_llm()
 
+# Precompiled patterns used to clean and tokenize search queries.
+CODE_FENCE_PATTERN = re.compile(r'```.*?```', flags=re.DOTALL)
+WORD_PATTERN = re.compile(r'\w+')
+
 class ResearchPaperAgent:
     """Agent for academic paper research and citation management"""
     
@@ -35,6 +39,11 @@ class ResearchPaperAgent:
         self.arxiv_base = "http://export.arxiv.org/api/query"
         self.semantic_base = "https://api.semanticscholar.org/graph/v1"
         self.llm = llm
+
+        # Shared HTTP session: keeps TLS connections to the paper APIs
+        # alive across searches instead of reconnecting on every request.
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "research-agent/1.0"})
     
     def search_arxiv(self, query: str, max_results: int = 10) -> List[Dict]:
         """Search ArXiv for academic papers"""
@@ -47,7 +56,7 @@ class ResearchPaperAgent:
         }
         
         try:
-            response = requests.get(self.arxiv_base, params=params, timeout=10)
+            response = self.session.get(self.arxiv_base, params=params, timeout=10)
             response.raise_for_status()
             
             # Parse XML response
@@ -83,8 +92,7 @@ class ResearchPaperAgent:
                 'fields': 'title,authors,year,abstract,citationCount,url'
             }
             
-            headers = {"User-Agent": "research-agent/1.0"}
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
@@ -298,7 +306,7 @@ def search_research_papers_tool(query: str, max_results: int = 10) -> str:
     Search academic papers from ArXiv and Semantic Scholar.
     Use this to find related research for literature reviews.
     """
-    query = re.sub(r'```.*?```', '', query, flags=re.DOTALL).strip()
+    query = CODE_FENCE_PATTERN.sub('', query).strip()
     print("🔧 Agent is using tool: search_research_papers_tool")
     agent = get_research_agent()
     
@@ -319,7 +327,7 @@ def search_research_papers_tool(query: str, max_results: int = 10) -> str:
     all_papers = unique_papers
     # ✅ NEW: Relevance filtering
 
-    query_keywords = re.findall(r'\w+', query.lower())
+    query_keywords = WORD_PATTERN.findall(query.lower())
     query_keywords = [w for w in query_keywords if len(w) > 3]
 
     filtered_papers = []
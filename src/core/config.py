@@ -0,0 +1,24 @@
+"""
+Centralized environment configuration.
+
+Loads the .env file once at import time and exposes the settings used
+across the application, so individual modules do not re-read it.
+"""
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+GEMINI_KEY = os.getenv("GEMINI_KEY")
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+
+# Smaller model for lightweight calls such as intent routing.
+GEMINI_FAST_MODEL = os.getenv("GEMINI_FAST_MODEL", "gemini-2.5-flash-lite")
+
+GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+
+# Parallel LLM requests when summarizing repository files. Kept low by
+# default to stay within typical per-minute Gemini request limits.
+GITHUB_SUMMARY_CONCURRENCY = int(os.getenv("GITHUB_SUMMARY_CONCURRENCY", "2"))
+
+MONGO_URI = os.getenv("MONGO_URI")
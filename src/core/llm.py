@@ -6,9 +6,10 @@ This module ensures all agents share a single initialized language model
 instance instead of repeatedly creating new clients.
 """
 from langchain_google_genai import ChatGoogleGenerativeAI
-import os
+from src.core.config import GEMINI_KEY, GEMINI_MODEL, GEMINI_FAST_MODEL
 
 _llm = None
+_fast_llm = None
 
 def get_llm(temperature=0.3):
     """
@@ -27,9 +28,35 @@ def get_llm(temperature=0.3):
 
     if _llm is None:
         _llm = ChatGoogleGenerativeAI(
-            model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"),
-            google_api_key=os.getenv("GEMINI_KEY"),
+            model=GEMINI_MODEL,
+            google_api_key=GEMINI_KEY,
             temperature=temperature
         )
 
-    return _llm
\ No newline at end of file
+    return _llm
+
+
+def get_fast_llm(temperature=0):
+    """
+    Return shared lightweight Gemini chat model instance.
+
+    Used for short, low-reasoning calls such as routing decisions, where
+    a smaller model answers faster and cheaper than the main one.
+
+    Args:
+        temperature: Sampling temperature for response creativity.
+
+    Returns:
+        ChatGoogleGenerativeAI instance.
+    """
+
+    global _fast_llm
+
+    if _fast_llm is None:
+        _fast_llm = ChatGoogleGenerativeAI(
+            model=GEMINI_FAST_MODEL,
+            google_api_key=GEMINI_KEY,
+            temperature=temperature
+        )
+
+    return _fast_llm
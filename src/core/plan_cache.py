@@ -0,0 +1,140 @@
+"""
+Per-project cache for generated project plans.
+
+Plan generation is the slowest and most expensive LLM call in the
+application, and users frequently re-request a plan for a project whose
+context has not changed. This module lets the planner skip the call by
+mapping a hash of the normalized planning context to the plan JSON.
+
+Entries are scoped by project ID so one project can never be served
+another project's plan. Callers key the cache on the full refinement
+context (memory, user requests and saved project state, minus IDs and
+timestamps), so any discussed change produces a new key.
+
+Entries are persisted to disk as JSON so cached plans survive app
+restarts.
+"""
+import hashlib
+import os
+
+import orjson
+
+
+# Anchored to the repository root so the cache does not depend on the
+# directory the app is launched from.
+CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    ".cache",
+    "plans.json"
+)
+
+# Maximum number of plans kept per project.
+MAX_ENTRIES_PER_PROJECT = 32
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace so trivial edits share a key."""
+    return " ".join(text.lower().split())
+
+
+def _key(context: str) -> str:
+    """Return the cache key for a planning context."""
+    return hashlib.sha256(normalize(context).encode("utf-8")).hexdigest()
+
+
+class PlanCache:
+    """
+    Exact-match cache mapping (project ID, planning context) to plan JSON.
+    """
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+
+        self.projects = {}
+
+        self._load()
+
+    # ---------------- PERSISTENCE ----------------
+    def _load(self):
+        """Restore cached entries from disk, ignoring unreadable files."""
+        try:
+            with open(self.path, "rb") as f:
+                data = orjson.loads(f.read())
+
+            self.projects = data["projects"]
+
+        except Exception:
+            pass
+
+    def _save(self):
+        """Write all cached entries to disk."""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            with open(self.path, "wb") as f:
+                f.write(orjson.dumps({"projects": self.projects}))
+
+        except Exception as e:
+            print("Plan cache save error:", e)
+
+    # ---------------- LOOKUP ----------------
+    def get(self, project_id: str, context: str):
+        """
+        Look up a cached plan for a project's planning context.
+
+        Args:
+            project_id: Project the plan belongs to.
+            context: Planning context without volatile fields.
+
+        Returns:
+            Plan JSON or None.
+        """
+        return self.projects.get(project_id, {}).get(_key(context))
+
+    def put(self, project_id: str, context: str, plan_json: str):
+        """
+        Store a freshly generated plan for a project.
+
+        Args:
+            project_id: Project the plan belongs to.
+            context: Planning context without volatile fields.
+            plan_json: Plan returned by the LLM.
+        """
+        key = _key(context)
+
+        entry = self.projects.setdefault(project_id, {})
+
+        if key not in entry and len(entry) >= MAX_ENTRIES_PER_PROJECT:
+            entry.pop(next(iter(entry)))
+
+        entry[key] = plan_json
+
+        self._save()
+
+    def invalidate(self, project_id: str):
+        """
+        Drop every cached plan for a project.
+
+        Args:
+            project_id: Project whose plans should be discarded.
+        """
+        if self.projects.pop(project_id, None) is not None:
+            self._save()
+
+
+# Lazy loader
+plan_cache = None
+
+
+def get_plan_cache():
+    """
+    Return shared PlanCache instance.
+
+    Returns:
+        PlanCache
+    """
+    global plan_cache
+
+    if plan_cache is None:
+        plan_cache = PlanCache()
+
+    return plan_cache
@@ -7,12 +7,9 @@ Stores:
 - timestamps
 """
 from pymongo import MongoClient
-import os
-from dotenv import load_dotenv
+from src.core.config import MONGO_URI
 from datetime import datetime
 
-load_dotenv()
-
 
 class MongoDB:
     """
@@ -20,7 +17,7 @@ class MongoDB:
     """
     def __init__(self):
         """Connect to MongoDB and initialize collections."""
-        self.client = MongoClient(os.getenv("MONGO_URI"))
+        self.client = MongoClient(MONGO_URI)
         self.db = self.client["agent_memory"]
 
         self.projects = self.db["projects"]
@@ -2,10 +2,7 @@
 MongoDB storage for chat sessions and rolling conversation memory.
 """
 from pymongo import MongoClient
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
+from src.core.config import MONGO_URI
 
 class MongoMemory:
     """
@@ -13,7 +10,7 @@ class MongoMemory:
     """
     def __init__(self):
 
-        self.client = MongoClient(os.getenv("MONGO_URI"))
+        self.client = MongoClient(MONGO_URI)
         self.db = self.client["agent_memory"]
         self.sessions = self.db["sessions"]
 
@@ -4,13 +4,11 @@ Vector memory layer backed by MongoDB Atlas vector search.
 Used for semantic retrieval of prior project conversations,
 summaries, and code analysis data.
 """
-import os
 from pymongo import MongoClient
-from dotenv import load_dotenv
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_core.documents import Document
 
-load_dotenv()
+from src.core.config import GEMINI_KEY, MONGO_URI
 
 
 class MongoVectorMemory:
@@ -19,13 +17,13 @@ class MongoVectorMemory:
     """
     def __init__(self):
         """Initialize MongoDB collection and embedding model."""
-        self.client = MongoClient(os.getenv("MONGO_URI"))
+        self.client = MongoClient(MONGO_URI)
         self.db = self.client["agent_memory"]
         self.collection = self.db["vector_memory"]
 
         self.embedding = GoogleGenerativeAIEmbeddings(
             model="models/gemini-embedding-001",
-            google_api_key=os.getenv("GEMINI_KEY")
+            google_api_key=GEMINI_KEY
         )
 
     def add_memory(self, text, metadata):